@@ -1,7 +1,19 @@
 import * as THREE from "https://cdn.jsdelivr.net/npm/three@0.161/build/three.module.js";
 
+const TAU = Math.PI * 2.0;
+
 const canvas = document.getElementById("blackhole-canvas");
-const renderer = new THREE.WebGLRenderer({ canvas, antialias: true, alpha: false });
+// A single fullscreen quad has no geometry edges to antialias and never depth tests,
+// so skip the multisample, depth and stencil attachments entirely. Ask for the discrete GPU
+// on dual-GPU machines, since the fragment shader is the whole frame cost.
+const renderer = new THREE.WebGLRenderer({
+  canvas,
+  antialias: false,
+  alpha: false,
+  depth: false,
+  stencil: false,
+  powerPreference: "high-performance",
+});
 // Fixed 1080p resolution for 60fps rendering
 renderer.setPixelRatio(1);
 renderer.setSize(1920, 1080);
@@ -11,6 +23,8 @@ const camera = new THREE.OrthographicCamera(-1, 1, 1, -1, 0.1, 10);
 camera.position.set(0, 0, 1);
 camera.lookAt(0, 0, 0);
 renderer.setClearColor(0x02030b, 1);
+// The fullscreen quad overwrites every pixel, so skip the per-frame clear
+renderer.autoClear = false;
 
 async function loadShader(path) {
   const response = await fetch(path);
@@ -35,13 +49,16 @@ function createFallbackPalette() {
   return texture;
 }
 
+// Reference images are resampled to this square before their palette band is read
+const PALETTE_SAMPLE_SIZE = 256;
+
 function createCombinedPalette(sources) {
   if (sources.length === 0) {
     return null;
   }
 
-  const width = 256;
-  const sampleHeight = 256;
+  const width = PALETTE_SAMPLE_SIZE;
+  const sampleHeight = PALETTE_SAMPLE_SIZE;
   const canvas = document.createElement("canvas");
   canvas.width = width;
   canvas.height = sampleHeight;
@@ -52,6 +69,7 @@ function createCombinedPalette(sources) {
   ctx.imageSmoothingEnabled = true;
 
   const accum = new Float32Array(width * 3);
+  const columnSums = new Uint32Array(width * 3);
   let usableCount = 0;
   const sampleStart = Math.floor(sampleHeight * 0.32);
   const sampleEnd = Math.ceil(sampleHeight * 0.68);
@@ -62,21 +80,21 @@ function createCombinedPalette(sources) {
     try {
       ctx.clearRect(0, 0, width, sampleHeight);
       ctx.drawImage(source, 0, 0, width, sampleHeight);
-      const imageData = ctx.getImageData(0, 0, width, sampleHeight);
+      // Only the middle band feeds the palette; skip reading back the rest
+      const imageData = ctx.getImageData(0, sampleStart, width, sampleRows);
       const data = imageData.data;
-      for (let x = 0; x < width; x += 1) {
-        let r = 0;
-        let g = 0;
-        let b = 0;
-        for (let y = sampleStart; y < sampleEnd; y += 1) {
-          const idx = (y * width + x) * 4;
-          r += data[idx + 0];
-          g += data[idx + 1];
-          b += data[idx + 2];
+      // Walk the band row by row so reads stay sequential in memory
+      columnSums.fill(0);
+      let idx = 0;
+      for (let y = 0; y < sampleRows; y += 1) {
+        for (let x = 0; x < width; x += 1, idx += 4) {
+          columnSums[x * 3 + 0] += data[idx + 0];
+          columnSums[x * 3 + 1] += data[idx + 1];
+          columnSums[x * 3 + 2] += data[idx + 2];
         }
-        accum[x * 3 + 0] += (r * invRows) / 255;
-        accum[x * 3 + 1] += (g * invRows) / 255;
-        accum[x * 3 + 2] += (b * invRows) / 255;
+      }
+      for (let i = 0; i < width * 3; i += 1) {
+        accum[i] += (columnSums[i] * invRows) / 255;
       }
       usableCount += 1;
     } catch (error) {
@@ -112,15 +130,14 @@ function createCombinedPalette(sources) {
     scale = 2.5;
   }
 
-  const output = new Uint8Array(width * 4);
+  // Write through a clamped view so the typed array does the round-and-clamp to 0..255
+  const output = new Uint8Array(width * 4).fill(255);
+  const clamped = new Uint8ClampedArray(output.buffer);
+  const byteScale = scale * 255;
   for (let i = 0; i < width; i += 1) {
-    const r = Math.min(1, averaged[i * 3 + 0] * scale);
-    const g = Math.min(1, averaged[i * 3 + 1] * scale);
-    const b = Math.min(1, averaged[i * 3 + 2] * scale);
-    output[i * 4 + 0] = Math.max(0, Math.min(255, Math.round(r * 255)));
-    output[i * 4 + 1] = Math.max(0, Math.min(255, Math.round(g * 255)));
-    output[i * 4 + 2] = Math.max(0, Math.min(255, Math.round(b * 255)));
-    output[i * 4 + 3] = 255;
+    clamped[i * 4 + 0] = averaged[i * 3 + 0] * byteScale;
+    clamped[i * 4 + 1] = averaged[i * 3 + 1] * byteScale;
+    clamped[i * 4 + 2] = averaged[i * 3 + 2] * byteScale;
   }
 
   const dataTexture = new THREE.DataTexture(output, width, 1, THREE.RGBAFormat);
@@ -134,6 +151,73 @@ function createCombinedPalette(sources) {
   return dataTexture;
 }
 
+// Palette positions the fragment shader reads at fixed t; resolved once here instead of per pixel
+const PALETTE_STOPS = {
+  u_paletteShadow: 0.05,
+  u_paletteMid: 0.3,
+  u_paletteBright: 0.72,
+  u_paletteGlow: 0.88,
+};
+
+function srgbToLinear(value) {
+  return value <= 0.04045 ? value / 12.92 : Math.pow((value + 0.055) / 1.055, 2.4);
+}
+
+// CPU mirror of a clamp-to-edge, bilinear texture2D fetch from an RGBA8 DataTexture
+function fetchTexel(texture, u, v, target) {
+  const { data, width, height } = texture.image;
+  const decode = texture.colorSpace === THREE.SRGBColorSpace ? srgbToLinear : (value) => value;
+  const x = THREE.MathUtils.clamp(u * width - 0.5, 0, width - 1);
+  const y = THREE.MathUtils.clamp(v * height - 0.5, 0, height - 1);
+  const x0 = Math.floor(x);
+  const y0 = Math.floor(y);
+  const x1 = Math.min(x0 + 1, width - 1);
+  const y1 = Math.min(y0 + 1, height - 1);
+  const fx = x - x0;
+  const fy = y - y0;
+  for (let c = 0; c < 3; c += 1) {
+    const a = decode(data[(y0 * width + x0) * 4 + c] / 255);
+    const b = decode(data[(y0 * width + x1) * 4 + c] / 255);
+    const d = decode(data[(y1 * width + x0) * 4 + c] / 255);
+    const e = decode(data[(y1 * width + x1) * 4 + c] / 255);
+    target[c] = THREE.MathUtils.lerp(THREE.MathUtils.lerp(a, b, fx), THREE.MathUtils.lerp(d, e, fx), fy);
+  }
+}
+
+// Same five-tap kernel as samplePalette() in blackhole.frag.glsl
+function samplePaletteColor(texture, t) {
+  const baseU = THREE.MathUtils.clamp(t, 0, 1);
+  const color = new THREE.Vector3();
+  const texel = [0, 0, 0];
+  let weight = 0;
+  for (let i = -2; i <= 2; i += 1) {
+    const offset = i * 0.015;
+    const w = 1 - Math.abs(i) * 0.22;
+    fetchTexel(texture, THREE.MathUtils.clamp(baseU + offset, 0, 1), THREE.MathUtils.clamp(0.5 + offset * 0.4, 0, 1), texel);
+    color.x += texel[0] * w;
+    color.y += texel[1] * w;
+    color.z += texel[2] * w;
+    weight += w;
+  }
+  return color.divideScalar(weight);
+}
+
+// Terms of blackhole.frag.glsl that depend only on uniforms, evaluated once per frame
+// here instead of once per pixel
+function updateDerivedUniforms(uniforms) {
+  const { clamp, lerp } = THREE.MathUtils;
+  const angle = uniforms.u_time.value;
+  const acceleration = uniforms.u_acceleration.value;
+  uniforms.u_orbitA.value.set(Math.cos(angle), Math.sin(angle));
+  uniforms.u_orbitB.value.set(Math.cos(angle * 0.5), Math.sin(angle * 0.5));
+  uniforms.u_orbitC.value.set(Math.cos(angle * 0.3), Math.sin(angle * 0.3));
+  uniforms.u_lensStrength.value = lerp(0.38, 0.65, uniforms.u_warp.value);
+  uniforms.u_speedInfluence.value = lerp(0.85, 1.55, clamp(acceleration * 0.45, 0, 1));
+  const beta = lerp(0.55, 0.72, clamp(acceleration * 0.55, 0, 1));
+  uniforms.u_velBeta.value = beta;
+  uniforms.u_velGamma.value = 1 / Math.sqrt(Math.max(1e-5, 1 - beta * beta));
+}
+
 async function loadImageSource(path) {
   const response = await fetch(path);
   if (!response.ok) {
@@ -143,7 +227,13 @@ async function loadImageSource(path) {
   const blob = await response.blob();
 
   if ("createImageBitmap" in window) {
-    const bitmap = await createImageBitmap(blob);
+    // Decode straight to the palette sampling size so parallel loads never hold
+    // full-resolution screenshots in memory; browsers without resize support ignore the options
+    const bitmap = await createImageBitmap(blob, {
+      resizeWidth: PALETTE_SAMPLE_SIZE,
+      resizeHeight: PALETTE_SAMPLE_SIZE,
+      resizeQuality: "high",
+    });
     const cleanup = () => {
       if (bitmap.close) {
         bitmap.close();
@@ -170,11 +260,6 @@ async function loadImageSource(path) {
 }
 
 async function init() {
-  const [vertexShader, fragmentShader] = await Promise.all([
-    loadShader("shaders/fullscreen.vert.glsl"),
-    loadShader("shaders/blackhole.frag.glsl"),
-  ]);
-
   const textureCandidates = [
     "assets/textures/blackhole_reference.jpg",
     "assets/textures/Screenshot 2025-11-04 163420.png",
@@ -186,45 +271,83 @@ async function init() {
     "assets/textures/Screenshot 2025-11-04 192405.png",
   ];
 
-  const imageSources = [];
-  for (const path of textureCandidates) {
-    try {
-      const { source, cleanup } = await loadImageSource(path);
-      imageSources.push({ source, cleanup, path });
-      console.info(`Loaded reference image from ${path}`);
-    } catch (error) {
-      console.warn(`Unable to load ${path}`, error);
-    }
-  }
+  // Fetch and decode every reference in parallel instead of one round-trip at a time,
+  // overlapping the downloads with the shader fetches below
+  const pendingSources = Promise.allSettled(textureCandidates.map((path) => loadImageSource(path)));
 
-  const combinedPalette = createCombinedPalette(imageSources.map((entry) => entry.source)) || createFallbackPalette();
-  imageSources.forEach((entry) => {
-    if (entry.cleanup) {
-      entry.cleanup();
-    }
-  });
+  const [vertexShader, fragmentShader] = await Promise.all([
+    loadShader("shaders/fullscreen.vert.glsl"),
+    loadShader("shaders/blackhole.frag.glsl"),
+  ]);
 
   const uniforms = {
     u_time: { value: 0 },
     u_cycle: { value: 0 },
     u_elapsed: { value: 0 }, // Continuous time for seamless rotation
-    u_resolution: { value: new THREE.Vector2(1920, 1080) },
-    u_baseTexture: { value: combinedPalette },
+    u_baseTexture: { value: null }, // Filled in once the reference images are decoded
     u_acceleration: { value: 1.2 },
     u_warp: { value: 0.85 },
     u_jetIntensity: { value: 1.05 },
+    u_orbitA: { value: new THREE.Vector2() },
+    u_orbitB: { value: new THREE.Vector2() },
+    u_orbitC: { value: new THREE.Vector2() },
+    u_lensStrength: { value: 0 },
+    u_speedInfluence: { value: 0 },
+    u_velBeta: { value: 0 },
+    u_velGamma: { value: 0 },
   };
+  Object.keys(PALETTE_STOPS).forEach((name) => {
+    uniforms[name] = { value: new THREE.Vector3() };
+  });
 
   const material = new THREE.ShaderMaterial({
     uniforms,
     vertexShader,
     fragmentShader,
     side: THREE.DoubleSide,
+    depthTest: false,
+    depthWrite: false,
   });
 
   const geometry = new THREE.PlaneGeometry(2, 2);
   const mesh = new THREE.Mesh(geometry, material);
+  // The vertex shader emits clip-space positions directly, so skip per-frame
+  // matrix propagation and frustum tests for this static quad
+  mesh.frustumCulled = false;
+  mesh.matrixAutoUpdate = false;
   scene.add(mesh);
+  scene.matrixWorldAutoUpdate = false;
+
+  // Compile the shader program while the reference images are still decoding; the
+  // palette texture and stops are plain uniform values and do not affect the program
+  const pendingCompile = renderer.compileAsync(scene, camera);
+
+  const results = await pendingSources;
+  const imageSources = [];
+  results.forEach((result, index) => {
+    const path = textureCandidates[index];
+    if (result.status === "fulfilled") {
+      const { source, cleanup } = result.value;
+      imageSources.push({ source, cleanup, path });
+      console.info(`Loaded reference image from ${path}`);
+    } else {
+      console.warn(`Unable to load ${path}`, result.reason);
+    }
+  });
+
+  const combinedPalette = createCombinedPalette(imageSources.map((entry) => entry.source)) || createFallbackPalette();
+  imageSources.forEach((entry) => {
+    if (entry.cleanup) {
+      entry.cleanup();
+    }
+  });
+
+  uniforms.u_baseTexture.value = combinedPalette;
+  Object.entries(PALETTE_STOPS).forEach(([name, t]) => {
+    uniforms[name].value = samplePaletteColor(combinedPalette, t);
+  });
+
+  await pendingCompile;
 
   // Fixed 1080p - no resize handler needed
 
@@ -237,8 +360,9 @@ async function init() {
     const looped = adjusted % LOOP_DURATION;
     const phase = looped / LOOP_DURATION;
     uniforms.u_cycle.value = phase;
-    uniforms.u_time.value = phase * Math.PI * 2.0;
+    uniforms.u_time.value = phase * TAU;
     uniforms.u_elapsed.value = adjusted; // Continuous time for seamless infinite rotation
+    updateDerivedUniforms(uniforms);
 
     renderer.render(scene, camera);
     requestAnimationFrame(animate);
@@ -1,17 +1,26 @@
 precision highp float;
 
 uniform sampler2D u_baseTexture;
-uniform vec2 u_resolution;
-uniform float u_time;
 uniform float u_cycle;
 uniform float u_elapsed; // Continuous time for seamless rotation
-uniform float u_acceleration;
 uniform float u_warp;
 uniform float u_jetIntensity;
+// Constant palette stops, pre-sampled on the CPU with the same kernel as samplePalette()
+uniform vec3 u_paletteShadow;
+uniform vec3 u_paletteMid;
+uniform vec3 u_paletteBright;
+uniform vec3 u_paletteGlow;
+// Uniform-only terms folded per frame on the CPU (see updateDerivedUniforms in main.js)
+uniform vec2 u_orbitA;
+uniform vec2 u_orbitB;
+uniform vec2 u_orbitC;
+uniform float u_lensStrength;
+uniform float u_speedInfluence;
+uniform float u_velBeta;
+uniform float u_velGamma;
 
 varying vec2 v_uv;
 
-const float PI = 3.141592653589793;
 const float TAU = 6.283185307179586;
 const float EVENT_HORIZON = 0.22;
 const float PHOTON_SPHERE = 0.29;
@@ -92,30 +101,13 @@ float fbmFast(vec2 uv) {
     return value;
 }
 
-// Enhanced star field with multiple sizes and colors
-float starFieldEnhanced(vec2 uv, float cycle, float density, float sizeVariation, float seed) {
-    float baseAngle = cycle * TAU;
-    vec2 shift = vec2(cos(baseAngle + seed), sin(baseAngle + seed)) * 0.012;
-    vec2 grid = (uv + shift) * density;
-    vec2 cell = floor(grid);
-    vec2 local = fract(grid) - 0.5;
-    float dist = length(local);
-    float rnd = hash(cell + seed);
-    
-    // Seamless twinkle
-    float twinkleSpeed = 1.2 + hash(cell + seed + 13.7) * 1.8;
-    float twinklePhase = hash(cell + seed + 27.3) * TAU;
-    float twinkle = 0.6 + 0.4 * cos(baseAngle * twinkleSpeed + twinklePhase);
-    
-    // Variable star sizes
-    float starSize = 0.4 + hash(cell + seed + 41.1) * sizeVariation;
-    float star = saturate(starSize - dist * (3.0 + hash(cell + seed + 55.9) * 4.0));
-    
-    // Variable star density
-    float threshold = 1.0 - density * 0.003;
-    star *= step(threshold, rnd);
-    
-    return star * twinkle;
+// Single point-star layer: one hashed cell per grid square lights up above `threshold`
+vec3 starLayer(vec2 uv, float density, float threshold, float sharpness, float twinkleBase, float twinkleAmount, float twinkleFreq, vec3 tint, float gain) {
+    vec2 grid = uv * density;
+    float rnd = hash(floor(grid));
+    float star = step(threshold, rnd) * saturate(1.0 - length(fract(grid) - 0.5) * sharpness);
+    float twinkle = twinkleBase + twinkleAmount * sin(rnd * twinkleFreq);
+    return tint * star * twinkle * gain;
 }
 
 // Optimized distant galaxy - much simpler
@@ -148,12 +140,6 @@ float dustLanes(vec2 uv, vec2 offset) {
     return saturate(fbmFast(vec2(p.x * 15.0, p.y * 3.0)));
 }
 
-// Optimized filaments
-float filamentStructure(vec2 uv, vec2 offset, float angle) {
-    vec2 p = rotate(uv + offset, angle);
-    return pow(saturate(fbmFast(vec2(p.x * 25.0, p.y * 4.0))), 3.0);
-}
-
 float ringMask(float radius, float inner, float outer, float softness) {
     float innerEdge = smoothstep(inner - softness, inner + softness, radius);
     float outerEdge = smoothstep(outer - softness, outer + softness, radius);
@@ -205,33 +191,43 @@ float schwarzschildRedshift(float r, float schwarzschildRadius) {
     return clamp(redshift, 0.35, 1.0);
 }
 
-float relativisticBeaming(float cosTheta, float beta) {
-    float gamma = inversesqrt(max(1e-5, 1.0 - beta * beta));
+float relativisticBeaming(float cosTheta, float beta, float gamma) {
     float doppler = 1.0 / (gamma * (1.0 - beta * cosTheta));
     return pow(doppler, 3.0);
 }
 
 void main() {
-    float loopAngle = u_time;
     float cycle = u_cycle;
     vec2 rawUV = v_uv;
 
     float schwarzschildRadius = PHOTON_SPHERE;
     float lensTerm = 0.0;
-    float lensStrength = mix(0.38, 0.65, u_warp);
+    float lensStrength = u_lensStrength;
     vec2 lensUV = gravitationalLens(rawUV, schwarzschildRadius, lensStrength, lensTerm);
     vec2 centered = lensUV * 2.0 - 1.0;
 
+    vec2 warped = mix(lensUV, lensWarp(lensUV, 0.08 + 0.05 * u_warp), 0.35);
+    vec2 swirled = mix(warped, swirl(warped, 0.08 + u_warp * 0.18), 0.55);
+    vec2 polar = tiltedPolar(swirled);
+    float r = polar.x;
+
+    // Inside the shadow holeMask and innerMask are both zero, so every term below
+    // multiplies out to black; skip the background and disk work entirely
+    if (r <= EVENT_HORIZON * 0.7) {
+        gl_FragColor = vec4(0.0, 0.0, 0.0, 1.0);
+        return;
+    }
+
     // Use smooth periodic functions for seamless looping - no discontinuities
-    vec2 orbitA = vec2(cos(loopAngle), sin(loopAngle));
-    vec2 orbitB = vec2(cos(loopAngle * 0.5), sin(loopAngle * 0.5));
-    vec2 orbitC = vec2(cos(loopAngle * 0.3), sin(loopAngle * 0.3));
-    float speedInfluence = mix(0.85, 1.55, saturate(u_acceleration * 0.45));
+    vec2 orbitA = u_orbitA;
+    vec2 orbitB = u_orbitB;
+    vec2 orbitC = u_orbitC;
+    float speedInfluence = u_speedInfluence;
 
-    vec3 paletteShadow = sampleCombinedPalette(0.05);
-    vec3 paletteMid = sampleCombinedPalette(0.3);
-    vec3 paletteBright = sampleCombinedPalette(0.72);
-    vec3 paletteGlow = sampleCombinedPalette(0.88);
+    vec3 paletteShadow = u_paletteShadow;
+    vec3 paletteMid = u_paletteMid;
+    vec3 paletteBright = u_paletteBright;
+    vec3 paletteGlow = u_paletteGlow;
 
     // ========== COSMIC BACKGROUND WITH LENSING ==========
     vec3 background = paletteShadow * 0.02;
@@ -255,34 +251,11 @@ void main() {
     vec3 galaxyColor1 = mix(vec3(1.0, 0.9, 0.7), vec3(1.0, 1.0, 1.0), 0.6) * galaxy1 * 0.025;
     background += galaxyColor1;
 
-    vec2 starGrid1 = lensUV * 300.0;
-    vec2 starCell1 = floor(starGrid1);
-    float starRnd1 = hash(starCell1);
-    float star1 = step(0.99, starRnd1) * saturate(1.0 - length(fract(starGrid1) - 0.5) * 8.0);
-
-    vec2 starGrid2 = lensUV * 450.0;
-    vec2 starCell2 = floor(starGrid2);
-    float starRnd2 = hash(starCell2);
-    float star2 = step(0.995, starRnd2) * saturate(1.0 - length(fract(starGrid2) - 0.5) * 10.0);
-
-    float twinkle1 = 0.6 + 0.4 * sin(starRnd1 * 100.0);
-    float twinkle2 = 0.7 + 0.3 * sin(starRnd2 * 100.0);
-    background += vec3(0.95, 1.0, 1.1) * star1 * twinkle1 * 2.1;
-    background += vec3(1.1, 0.98, 0.9) * star2 * twinkle2 * 1.8;
-
-    vec2 starGrid3 = lensUV * 600.0;
-    vec2 starCell3 = floor(starGrid3);
-    float starRnd3 = hash(starCell3);
-    float star3 = step(0.997, starRnd3) * saturate(1.0 - length(fract(starGrid3) - 0.5) * 12.0);
-    float twinkle3 = 0.65 + 0.35 * sin(starRnd3 * 100.0);
-    background += vec3(1.1, 1.04, 1.0) * star3 * twinkle3 * 1.6;
-
-    vec2 starGrid4 = lensUV * 850.0;
-    vec2 starCell4 = floor(starGrid4);
-    float starRnd4 = hash(starCell4);
-    float star4 = step(0.9985, starRnd4) * saturate(1.0 - length(fract(starGrid4) - 0.5) * 14.0);
-    float twinkle4 = 0.7 + 0.3 * sin(starRnd4 * 120.0);
-    background += vec3(1.2, 1.05, 0.95) * star4 * twinkle4 * 2.2;
+    // Point-star layers, from the coarsest grid to the finest
+    background += starLayer(lensUV, 300.0, 0.99, 8.0, 0.6, 0.4, 100.0, vec3(0.95, 1.0, 1.1), 2.1);
+    background += starLayer(lensUV, 450.0, 0.995, 10.0, 0.7, 0.3, 100.0, vec3(1.1, 0.98, 0.9), 1.8);
+    background += starLayer(lensUV, 600.0, 0.997, 12.0, 0.65, 0.35, 100.0, vec3(1.1, 1.04, 1.0), 1.6);
+    background += starLayer(lensUV, 850.0, 0.9985, 14.0, 0.7, 0.3, 120.0, vec3(1.2, 1.05, 0.95), 2.2);
 
     float milkyWay = nebulaCloud(lensUV, vec2(0.0, 0.0), 1.5) * 0.028;
     background += paletteMid * milkyWay;
@@ -307,17 +280,13 @@ void main() {
     background += paletteMid * lensGlow * 0.05 * (0.7 + lensTerm);
 
     // ========== GEOMETRY AND ORBITAL SETUP ==========
-    vec2 warped = mix(lensUV, lensWarp(lensUV, 0.08 + 0.05 * u_warp), 0.35);
-    vec2 swirled = mix(warped, swirl(warped, 0.08 + u_warp * 0.18), 0.55);
-    vec2 polar = tiltedPolar(swirled);
-    float r = polar.x;
     float baseAngle = polar.y;
     float angle = baseAngle - u_elapsed * 0.15; // counter-clockwise
 
     float inclination = 0.72;
-    float velBeta = mix(0.55, 0.72, saturate(u_acceleration * 0.55));
+    float velBeta = u_velBeta;
     float cosView = sin(angle) * sin(inclination);
-    float beaming = relativisticBeaming(cosView, velBeta);
+    float beaming = relativisticBeaming(cosView, velBeta, u_velGamma);
     beaming = clamp(beaming, 0.4, 3.6);
     float spectralShift = clamp(pow(beaming, 0.2), 0.75, 1.35);
     float gravFade = schwarzschildRedshift(r, schwarzschildRadius);